@@ -23,6 +23,7 @@ import json
 import os
 import sys
 import gc
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
@@ -33,6 +34,17 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# Built once and reused by every state read/write in this module
+_ENCODE = json.JSONEncoder(indent=2).encode
+_DECODE = json.JSONDecoder().decode
+
+
+def _atomic_write_json(path: Path, obj: Any) -> None:
+    """Write JSON to a sibling temp file and atomically swap it into place."""
+    tmp = path.with_suffix('.json.tmp')
+    tmp.write_text(_ENCODE(obj))
+    os.replace(tmp, path)
+
 
 class SharedState:
     """Shared state management with multi-repository support"""
@@ -61,6 +73,9 @@ class SharedState:
         self.subagent_state_file = self.state_dir / "subagent_state.json"
         self.daic_cooldown_file = self.state_dir / "daic-cooldown.json"
 
+        # Per-repository state directories, created on first use
+        self._repo_state_dirs: Dict[str, Path] = {}
+
         # Ensure directories exist
         self._ensure_directories()
 
@@ -108,7 +123,9 @@ class SharedState:
         ]
 
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+            # A single stat is cheaper than mkdir on the common, already-set-up path
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
 
     def _load_multi_repo_config(self) -> Dict[str, Any]:
         """Load multi-repository configuration"""
@@ -140,7 +157,7 @@ class SharedState:
         if self.multi_repo_config_file.exists():
             try:
                 with open(self.multi_repo_config_file, 'r') as f:
-                    config = json.load(f)
+                    config = _DECODE(f.read())
                     # Merge with defaults
                     for key, value in default_config.items():
                         if key not in config:
@@ -158,7 +175,7 @@ class SharedState:
         if sessions_config_file.exists():
             try:
                 with open(sessions_config_file, 'r') as f:
-                    return json.load(f)
+                    return _DECODE(f.read())
             except Exception:
                 pass
 
@@ -174,7 +191,7 @@ class SharedState:
         """Save multi-repository configuration to file"""
         self.multi_repo_config_file.parent.mkdir(parents=True, exist_ok=True)
         with open(self.multi_repo_config_file, 'w') as f:
-            json.dump(self.multi_repo_config, f, indent=2)
+            f.write(_ENCODE(self.multi_repo_config))
 
     def register_repository(self, repo_path: Path, repo_name: str,
                           repo_type: str = 'unknown', description: str = '') -> None:
@@ -329,10 +346,11 @@ class SharedState:
 
     def get_workspace_context(self) -> Dict[str, Any]:
         """Get workspace-wide context information"""
+        active_repos = self.get_active_repositories()
         return {
             'workspace_name': self.multi_repo_config['workspace_name'],
-            'repository_count': len(self.get_active_repositories()),
-            'repositories': self.get_active_repositories(),
+            'repository_count': len(active_repos),
+            'repositories': active_repos,
             'shared_agents': self.multi_repo_config['shared_agents'],
             'cross_repo_tasks_enabled': self.multi_repo_config['cross_repo_tasks'],
             'context_sharing_enabled': self.multi_repo_config['context_sharing']
@@ -359,7 +377,7 @@ class SharedState:
         self._ensure_state_dir()
         try:
             with open(self.daic_state_file, 'r') as f:
-                data = json.load(f)
+                data = _DECODE(f.read())
                 return data.get("mode", "discussion") == "discussion"
         except (FileNotFoundError, json.JSONDecodeError):
             # Default to discussion mode if file doesn't exist
@@ -371,7 +389,7 @@ class SharedState:
         self._ensure_state_dir()
         try:
             with open(self.daic_state_file, 'r') as f:
-                data = json.load(f)
+                data = _DECODE(f.read())
                 mode = data.get("mode", "discussion")
                 return self._get_daic_mode_message(mode)
         except (FileNotFoundError, json.JSONDecodeError):
@@ -392,7 +410,7 @@ class SharedState:
             raise ValueError(f"Invalid mode value: {value}")
 
         with open(self.daic_state_file, 'w') as f:
-            json.dump({"mode": mode}, f, indent=2)
+            f.write(_ENCODE({"mode": mode}))
 
         # When switching to implementation, start a cooldown window
         if mode == "implementation":
@@ -403,8 +421,10 @@ class SharedState:
                 config = self._load_sessions_config()
                 cooldown_seconds = int(config.get('daic', {}).get('cooldown_seconds', cooldown_seconds))
                 expires_at = (datetime.now() + timedelta(seconds=cooldown_seconds)).isoformat()
+                # expires_ts lets readers compare against time.time() without parsing the ISO string
+                expires_ts = time.time() + cooldown_seconds
                 with open(self.daic_cooldown_file, 'w') as f:
-                    json.dump({"expires_at": expires_at, "seconds": cooldown_seconds}, f, indent=2)
+                    f.write(_ENCODE({"expires_at": expires_at, "expires_ts": expires_ts, "seconds": cooldown_seconds}))
             except Exception:
                 pass
         return name
@@ -415,7 +435,7 @@ class SharedState:
         # Read current mode
         try:
             with open(self.daic_state_file, 'r') as f:
-                data = json.load(f)
+                data = _DECODE(f.read())
                 current_mode = data.get("mode", "discussion")
         except (FileNotFoundError, json.JSONDecodeError):
             current_mode = "discussion"
@@ -423,7 +443,7 @@ class SharedState:
         # Toggle and write new value
         new_mode = "implementation" if current_mode == "discussion" else "discussion"
         with open(self.daic_state_file, 'w') as f:
-            json.dump({"mode": new_mode}, f, indent=2)
+            f.write(_ENCODE({"mode": new_mode}))
 
         # Return appropriate message
         return self._get_daic_mode_message(new_mode)
@@ -433,9 +453,12 @@ class SharedState:
         try:
             if not self.daic_cooldown_file.exists():
                 return False
-            from datetime import datetime
             with open(self.daic_cooldown_file, 'r') as f:
-                data = json.load(f)
+                data = _DECODE(f.read())
+            expires_ts = data.get('expires_ts')
+            if expires_ts is not None:
+                return time.time() < float(expires_ts)
+            # Cooldown files written before expires_ts existed only carry the ISO string
             exp = data.get('expires_at')
             if not exp:
                 return False
@@ -455,7 +478,7 @@ class SharedState:
         """Get current task state."""
         try:
             with open(self.task_state_file, 'r') as f:
-                return json.load(f)
+                return _DECODE(f.read())
         except (FileNotFoundError, json.JSONDecodeError):
             return {"task": None, "branch": None, "services": [], "updated": None}
 
@@ -469,7 +492,7 @@ class SharedState:
         }
         self._ensure_state_dir()
         with open(self.task_state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+            f.write(_ENCODE(state))
         return state
 
     def add_service_to_task(self, service: str) -> Dict[str, Any]:
@@ -479,7 +502,7 @@ class SharedState:
             state["services"].append(service)
             self._ensure_state_dir()
             with open(self.task_state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+                f.write(_ENCODE(state))
         return state
 
     # Cross-Repository Task Management
@@ -509,8 +532,7 @@ class SharedState:
 
         # Save workspace task
         task_file = self.workspace_state_dir / "workspace_tasks" / f"{task_id}.json"
-        with open(task_file, 'w') as f:
-            json.dump(task, f, indent=2)
+        _atomic_write_json(task_file, task)
 
         # Create project-specific subtasks
         for repo in affected_repos:
@@ -539,28 +561,36 @@ class SharedState:
         }
 
         # Save subtask in repository
-        repo_tasks_dir = Path(repo_path) / '.claude' / 'state'
-        repo_tasks_dir.mkdir(parents=True, exist_ok=True)
-
-        subtask_file = repo_tasks_dir / f"{subtask_id}.json"
-        with open(subtask_file, 'w') as f:
-            json.dump(subtask, f, indent=2)
+        subtask_file = self._repo_state_dir(repo_path) / f"{subtask_id}.json"
+        _atomic_write_json(subtask_file, subtask)
 
         return subtask
 
+    def _repo_state_dir(self, repo_path: str) -> Path:
+        """Return a repository's .claude/state directory, creating it on first use"""
+        state_dir = self._repo_state_dirs.get(repo_path)
+        if state_dir is None:
+            state_dir = Path(repo_path) / '.claude' / 'state'
+            state_dir.mkdir(parents=True, exist_ok=True)
+            self._repo_state_dirs[repo_path] = state_dir
+        return state_dir
+
     def get_workspace_tasks(self) -> List[Dict[str, Any]]:
         """Get all workspace-level tasks"""
         tasks = []
         workspace_tasks_dir = self.workspace_state_dir / "workspace_tasks"
 
-        if workspace_tasks_dir.exists():
-            for task_file in workspace_tasks_dir.glob('*.json'):
-                try:
-                    with open(task_file, 'r') as f:
-                        task = json.load(f)
-                        tasks.append(task)
-                except Exception:
-                    continue
+        try:
+            # One scandir instead of an exists() check plus a glob
+            names = [entry.name for entry in os.scandir(workspace_tasks_dir) if entry.name.endswith('.json')]
+        except FileNotFoundError:
+            names = []
+
+        for name in names:
+            try:
+                tasks.append(_DECODE((workspace_tasks_dir / name).read_text()))
+            except Exception:
+                continue
 
         return sorted(tasks, key=lambda x: x['created_at'], reverse=True)
 
@@ -570,7 +600,7 @@ class SharedState:
         try:
             if self.session_start_file.exists():
                 with open(self.session_start_file, 'r') as f:
-                    data = json.load(f)
+                    data = _DECODE(f.read())
                     return data.get('start_time')
         except Exception:
             pass
@@ -583,7 +613,7 @@ class SharedState:
 
         self._ensure_state_dir()
         with open(self.session_start_file, 'w') as f:
-            json.dump({'start_time': start_time}, f, indent=2)
+            f.write(_ENCODE({'start_time': start_time}))
 
     # Logging and Analytics
     def log_tool_usage(self, log_entry: Dict[str, Any]) -> None:
@@ -625,7 +655,7 @@ class SharedState:
         try:
             if self.subagent_state_file.exists():
                 with open(self.subagent_state_file, 'r') as f:
-                    return json.load(f)
+                    return _DECODE(f.read())
         except Exception:
             pass
         return {"sessions": {}}
@@ -634,7 +664,7 @@ class SharedState:
         try:
             self._ensure_state_dir()
             with open(self.subagent_state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(_ENCODE(data))
         except Exception:
             pass
 
@@ -767,7 +797,7 @@ class SharedState:
             # Try to read as JSON first (old format)
             try:
                 with open(log_file, 'r') as f:
-                    data = json.load(f)
+                    data = _DECODE(f.read())
                     if isinstance(data, list):
                         return data
             except (json.JSONDecodeError, ValueError):
@@ -780,7 +810,7 @@ class SharedState:
                     line = line.strip()
                     if line:
                         try:
-                            entry = json.loads(line)
+                            entry = _DECODE(line)
                             entries.append(entry)
                         except json.JSONDecodeError:
                             continue
@@ -811,7 +841,8 @@ class SharedState:
 
     def _ensure_state_dir(self) -> None:
         """Ensure the state directory exists."""
-        self.state_dir.mkdir(parents=True, exist_ok=True)
+        if not self.state_dir.is_dir():
+            self.state_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
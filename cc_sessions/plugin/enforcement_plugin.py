@@ -7,18 +7,25 @@ Purpose:
   existing cc-sessions Python hooks without duplicating logic.
 
 Notes:
-- This MVP shells out to the current hook entrypoints to preserve behavior.
+- Hooks run as a subprocess of the hook entrypoint by default. Setting
+  CC_SESSIONS_PLUGIN_IN_PROCESS=1 runs them in this interpreter instead
+  (redirected stdio, one run at a time) to skip interpreter startup; that
+  mode cannot enforce the hook timeout.
 - It is intentionally best-effort and non-blocking: failures are surfaced in
   return payloads rather than raising hard exceptions.
 """
 
 from __future__ import annotations
 
+import io
 import json
+import os
 import subprocess
 import sys
+import threading
+import traceback
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 def _repo_root() -> Path:
@@ -30,6 +37,86 @@ def _hook_path(rel: str) -> Path:
     return _repo_root() / "python" / "hooks" / rel
 
 
+def _exit_code(code: Any, stderr: io.TextIOBase) -> int:
+    # Mirror the interpreter's handling of SystemExit.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    stderr.write(f"{code}\n")
+    return 1
+
+
+# In-process runs swap process-wide stdio, argv, sys.path and cwd
+_IN_PROCESS_LOCK = threading.Lock()
+
+
+def _exec_hook(script: Path, stdin: str, cwd: Path, env: Optional[Dict[str, str]] = None) -> Optional[Tuple[int, str, str]]:
+    """Execute a hook script as __main__ in this interpreter; returns (exit_code, stdout, stderr).
+
+    Returns None when the script cannot be loaded; nothing has run at that
+    point, so the caller can fall back to a subprocess. Once the module body
+    starts, every failure (ImportError included) is reported as the hook's
+    result rather than retried. The hook sees the same argv, sys.path[0], cwd,
+    environment and stdio it would get from `python script`; all of it is
+    restored afterwards. shared_state resolves PROJECT_ROOT and loads config at
+    import, so it is dropped from sys.modules around each run.
+    """
+    try:
+        code = compile(script.read_bytes(), str(script), "exec")
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    stdin_stream = io.TextIOWrapper(io.BytesIO(stdin.encode("utf-8")), encoding="utf-8")
+    stdout, stderr = io.StringIO(), io.StringIO()
+    hook_globals = {"__name__": "__main__", "__file__": str(script), "__builtins__": __builtins__}
+
+    exit_code = 0
+    with _IN_PROCESS_LOCK:
+        saved_stdio = (sys.stdin, sys.stdout, sys.stderr)
+        saved_argv, saved_path, saved_cwd = sys.argv, list(sys.path), os.getcwd()
+        saved_env = {key: os.environ.get(key) for key in (env or {})}
+        sys.modules.pop("shared_state", None)
+        try:
+            os.environ.update(env or {})
+            sys.stdin, sys.stdout, sys.stderr = stdin_stream, stdout, stderr
+            sys.argv = [str(script)]
+            sys.path.insert(0, str(script.parent))
+            os.chdir(cwd)
+            exec(code, hook_globals)
+        except SystemExit as exc:
+            exit_code = _exit_code(exc.code, stderr)
+        except Exception:
+            traceback.print_exc(file=stderr)
+            exit_code = 1
+        finally:
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            sys.stdin, sys.stdout, sys.stderr = saved_stdio
+            sys.argv, sys.path[:] = saved_argv, saved_path
+            os.chdir(saved_cwd)
+            sys.modules.pop("shared_state", None)
+
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def _run_hook_in_process(script: Path, payload: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    # cwd is the project root (contains .claude), as for the subprocess path
+    result = _exec_hook(script, json.dumps(payload) if payload is not None else "", _repo_root().parent)
+    if result is None:
+        return None
+    exit_code, stdout, stderr = result
+    return {
+        "ok": exit_code == 0,
+        "exit_code": exit_code,
+        "stderr": stderr,
+        "stdout": stdout,
+    }
+
+
 def _run_hook(script_rel: str, payload: Optional[Dict[str, Any]] = None, timeout: int = 10) -> Dict[str, Any]:
     script = _hook_path(script_rel)
     if not script.exists():
@@ -41,6 +128,12 @@ def _run_hook(script_rel: str, payload: Optional[Dict[str, Any]] = None, timeout
             "stdout": "",
         }
 
+    # Opt-in only: in-process runs cannot enforce `timeout`
+    if os.environ.get("CC_SESSIONS_PLUGIN_IN_PROCESS") == "1":
+        result = _run_hook_in_process(script, payload)
+        if result is not None:
+            return result
+
     try:
         proc = subprocess.run(
             [sys.executable, str(script)],
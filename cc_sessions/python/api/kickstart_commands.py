@@ -204,6 +204,8 @@ def complete_kickstart(json_output: bool = False) -> Any:
             s.metadata['kickstart']['onboarding_complete'] = True
             s.metadata['kickstart']['completed_at'] = datetime.now().isoformat()
             # Keep metadata for hook detection during manual cleanup window
+    # Sentinel lets the SessionStart hook exit without loading state
+    (PROJECT_ROOT / 'sessions' / '.kickstart_done').touch()
 
     # Generate language-specific cleanup instructions based on which hook was found
     if is_python:
@@ -4,13 +4,17 @@
 
 ## ===== STDLIB ===== ##
 import sys
-import json
 import os
+import time
 from datetime import datetime
-from pathlib import Path
 ##-##
 
-## ===== 3RD-PARTY ===== ##
+## ===== FAST EXIT ===== ##
+# Onboarding already finished: exit before importing shared_state or parsing any state.
+# The sentinel is written by `kickstart complete` (and by the completed-flag check below).
+KICKSTART_DONE = os.path.join(os.environ.get('CLAUDE_PROJECT_DIR') or os.getcwd(), 'sessions', '.kickstart_done')
+if os.path.exists(KICKSTART_DONE):
+    sys.exit(0)
 ##-##
 
 ## ===== LOCAL ===== ##
@@ -23,10 +27,10 @@ if 'CLAUDE_PROJECT_DIR' in os.environ:
 
 try:
     # Try direct import (works with sessions in path or package install)
-    from shared_state import load_state, PROJECT_ROOT, edit_state
+    from shared_state import load_state, PROJECT_ROOT, edit_state, emit
 except ImportError:
     # Fallback to package import
-    from cc_sessions.hooks.shared_state import load_state, PROJECT_ROOT, edit_state
+    from cc_sessions.hooks.shared_state import load_state, PROJECT_ROOT, edit_state, emit
 ##-##
 
 #-#
@@ -69,6 +73,22 @@ SUBAGENTS_MODE_SEQUENCE = [
 ]
 ##-##
 
+## ===== COOLDOWN ===== ##
+# Minimum gap between showing the instructions to an in-progress user
+COOLDOWN_NS = 3600 * 1_000_000_000  # one hour
+##-##
+
+## ===== USER INSTRUCTIONS ===== ##
+# Appended to whichever protocol module is shown
+USER_INSTRUCTIONS = """
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+USER INSTRUCTIONS:
+Just say 'kickstart' and press enter to begin
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+##-##
+
 #-#
 
 # ===== FUNCTIONS ===== #
@@ -76,9 +96,10 @@ SUBAGENTS_MODE_SEQUENCE = [
 def load_protocol_file(relative_path: str) -> str:
     """Load protocol markdown from protocols directory."""
     protocol_path = PROJECT_ROOT / 'sessions' / 'protocols' / relative_path
-    if not protocol_path.exists():
+    try:
+        return protocol_path.read_text()
+    except FileNotFoundError:
         return f"Error: Protocol file not found: {relative_path}"
-    return protocol_path.read_text()
 
 #-#
 
@@ -106,17 +127,18 @@ if not kickstart_meta:
 
 # NEW: Check if kickstart is marked complete
 if kickstart_meta.get('onboarding_complete') is True:
-    # Kickstart completed - exit silently, allow normal session
+    # Kickstart completed - exit silently, allow normal session; leave the sentinel so later sessions skip the state load
+    (PROJECT_ROOT / 'sessions' / '.kickstart_done').touch()
     sys.exit(0)
 
 mode = kickstart_meta.get('mode')  # 'full' or 'subagents'
 if not mode:
-    print(json.dumps({
+    emit({
         "hookSpecificOutput": {
             "hookEventName": "SessionStart",
             "additionalContext": "ERROR: kickstart metadata exists but no mode specified. This is an installer bug."
         }
-    }))
+    })
     sys.exit(1)
 #!<
 
@@ -127,12 +149,12 @@ if mode == 'full':
 elif mode == 'subagents':
     sequence = SUBAGENTS_MODE_SEQUENCE
 else:
-    print(json.dumps({
+    emit({
         "hookSpecificOutput": {
             "hookEventName": "SessionStart",
             "additionalContext": f"ERROR: Invalid kickstart mode '{mode}'. Expected 'full' or 'subagents'."
         }
-    }))
+    })
     sys.exit(1)
 
 # Initialize sequence on first run
@@ -150,50 +172,53 @@ else:
 #!<
 
 #!> 2.5. Check cooldown and progress-aware logic
+last_shown_ns = kickstart_meta.get('last_shown_ns')
 last_shown = kickstart_meta.get('last_shown')
-now = datetime.now()
+# One clock read serves the cooldown check and every timestamp written below
+now_ns = time.time_ns()
+now = datetime.fromtimestamp(now_ns / 1_000_000_000)
+now_iso = now.isoformat()
 
 # If kickstart is in progress (current_index > 0), check cooldown
-if current_index > 0 and last_shown:
-    try:
-        last_shown_time = datetime.fromisoformat(last_shown.replace('Z', '+00:00'))
-        # Handle timezone-aware datetime
-        if last_shown_time.tzinfo:
-            now_aware = datetime.now(last_shown_time.tzinfo)
-        else:
-            now_aware = now
-        hours_since_shown = (now_aware - last_shown_time).total_seconds() / 3600
-
-        # If shown within last hour, skip instructions but update last_active
-        if hours_since_shown < 1:
-            with edit_state() as s:
-                s.metadata['kickstart']['last_active'] = datetime.now().isoformat()
-            sys.exit(0)  # Exit silently, allow normal session
-    except (ValueError, AttributeError):
-        # If timestamp parsing fails, continue to show instructions
-        pass
+shown_recently = False
+if current_index > 0:
+    if isinstance(last_shown_ns, int):
+        # Integer epoch written alongside last_shown: no parsing or tz arithmetic needed
+        shown_recently = now_ns - last_shown_ns < COOLDOWN_NS
+    elif last_shown:
+        # State written before last_shown_ns existed: fall back to the ISO timestamp
+        try:
+            last_shown_time = datetime.fromisoformat(last_shown.replace('Z', '+00:00'))
+            # Handle timezone-aware datetime
+            if last_shown_time.tzinfo:
+                now_aware = now.astimezone(last_shown_time.tzinfo)
+            else:
+                now_aware = now
+            shown_recently = (now_aware - last_shown_time).total_seconds() < COOLDOWN_NS / 1_000_000_000
+        except (ValueError, AttributeError):
+            # If timestamp parsing fails, continue to show instructions
+            pass
+
+# If shown within last hour, skip instructions but update last_active
+if shown_recently:
+    with edit_state() as s:
+        s.metadata['kickstart']['last_active'] = now_iso
+    sys.exit(0)  # Exit silently, allow normal session
 
 # If we reach here, we should show instructions
 # Update last_shown timestamp when displaying instructions
 with edit_state() as s:
-    s.metadata['kickstart']['last_shown'] = datetime.now().isoformat()
-    s.metadata['kickstart']['last_active'] = datetime.now().isoformat()
+    s.metadata['kickstart']['last_shown'] = now_iso
+    s.metadata['kickstart']['last_shown_ns'] = now_ns
+    s.metadata['kickstart']['last_active'] = now_iso
 #!<
 
 #!> 3. Append user instructions and output
-protocol_content += """
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-USER INSTRUCTIONS:
-Just say 'kickstart' and press enter to begin
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-
-print(json.dumps({
+emit({
     "hookSpecificOutput": {
         "hookEventName": "SessionStart",
-        "additionalContext": protocol_content
+        "additionalContext": protocol_content + USER_INSTRUCTIONS
     }
-}))
+})
 sys.exit(0)
 #!<
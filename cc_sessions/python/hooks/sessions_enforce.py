@@ -3,14 +3,12 @@
 # ===== IMPORTS ===== #
 
 ## ===== STDLIB ===== ##
-import subprocess, json, sys, re, shlex, os
+import sys, re, os
+# shlex and subprocess are imported where needed; most calls exit before either is used
 from typing import Optional
 from pathlib import Path
 ##-##
 
-## ===== 3RD-PARTY ===== ##
-##-##
-
 ## ===== LOCAL ===== ##
 from shared_state import (
     edit_state,
@@ -19,15 +17,28 @@ from shared_state import (
     PROJECT_ROOT,
     load_config,
     find_git_repo,
+    read_git_branch,
     CCTools,
+    read_hook_input,
+    json_line,
+    emit,
 )
 ##-##
 
 #-#
 
 # ===== GLOBALS ===== #
+## ===== TOOL NAMES ===== ##
+# Resolved once; the early exit below and the execution section compare against these
+PLAN_TOOL = CCTools.PLAN.value
+EXIT_PLAN_TOOL = CCTools.EXITPLANMODE.value
+ARTIFACT_WRITE_TOOLS = frozenset({"Write", "Edit", "MultiEdit"})
+STATE_FILE_WRITE_TOOLS = ARTIFACT_WRITE_TOOLS | {"NotebookEdit"}
+PLANNING_MODES = (Mode.NO, Mode.PLAN)
+##-##
+
 # Load input
-input_data = json.load(sys.stdin)
+input_data = read_hook_input()
 tool_name = input_data.get("tool_name", "")
 tool_input = input_data.get("tool_input", {})
 
@@ -36,13 +47,21 @@ file_path_string = tool_input.get("file_path", "")
 if file_path_string: file_path = Path(file_path_string)
 
 STATE = load_state()
+
+# In implementation mode only TodoWrite, the plan-mode tools, state-file writes and branch
+# enforcement have anything to check; exit before loading config or building patterns
+if (STATE.mode == Mode.GO
+        and tool_name not in ("TodoWrite", PLAN_TOOL, EXIT_PLAN_TOOL)
+        and not (file_path and (STATE.current_task.branch or file_path.name == 'sessions-state.json'))):
+    sys.exit(0)
+
 CONFIG = load_config()
 
 if tool_name == "Bash": command = tool_input.get("command", "").strip()
 if tool_name == "TodoWrite": incoming_todos = tool_input.get("todos", [])
 
 ## ===== PATTERNS ===== ##
-READONLY_FIRST = {
+READONLY_FIRST = frozenset({
     # Basic file reading
     'cat', 'less', 'more', 'head', 'tail', 'wc', 'nl', 'tac', 'rev',
     # Text search and filtering
@@ -85,11 +104,9 @@ READONLY_FIRST = {
     'ast-grep', 'sg', 'ast_grep',  # Syntax-aware code search
     # Note: awk/sed are here but need special argument checking
     'awk', 'sed', 'gawk', 'mawk', 'gsed',
-}
-
-READONLY_FIRST.update(CONFIG.blocked_actions.bash_read_patterns)
+}).union(CONFIG.blocked_actions.bash_read_patterns)
 
-WRITE_FIRST = {
+WRITE_FIRST = frozenset({
     # File operations
     'rm', 'rmdir', 'unlink', 'shred',
     'mv', 'rename', 'cp', 'install', 'dd',
@@ -109,9 +126,10 @@ WRITE_FIRST = {
     # Other dangerous
     'sudo', 'doas', 'su', 'crontab', 'at', 'batch',
     'kill', 'pkill', 'killall', 'tee',
-}
+}).union(CONFIG.blocked_actions.bash_write_patterns)
 
-WRITE_FIRST.update(CONFIG.blocked_actions.bash_write_patterns)
+# Commands that make `find -exec`/`-execdir` a write
+FIND_EXEC_WRITE = WRITE_FIRST | {'rm', 'mv', 'cp', 'shred'}
 
 # Enhanced redirection detection (includes stderr redirections)
 REDIR_PATTERNS = [
@@ -120,6 +138,22 @@ REDIR_PATTERNS = [
     r'(?:^|\s)&>',                           # Combined stdout/stderr redirect
 ]
 REDIR = re.compile('|'.join(REDIR_PATTERNS))
+
+# Allowed directories for work artifacts (a tuple, so startswith checks them all in one call)
+WORK_ARTIFACT_PREFIXES = (
+    'sessions/',
+    '.claude/',
+    'docs/',
+    'plans/',
+    'notes/',
+    'logs/',
+)
+
+# Characters that make a command need segment splitting and shlex tokenizing
+NEEDS_FULL_PARSE = re.compile(r'[|&\'"\\`]|[$<>]\(')
+
+# awk writing to a file from inside its script: > "file", >> 'file'
+AWK_FILE_OUTPUT = re.compile(r'>>?\s*["\'].*["\']')
 ##-##
 
 ## ===== CI DETECTION ===== ##
@@ -147,10 +181,21 @@ def _append_event(event: dict) -> None:
         event = dict(event or {})
         if "timestamp" not in event:
             event["timestamp"] = datetime.now().isoformat()
+        line = json_line(event)
+        # Each hook run logs at most one event and then exits, so there is nothing to batch;
+        # instead make the one append a single O_APPEND write (atomic across concurrent hooks)
         events_file = PROJECT_ROOT / "sessions" / "sessions-events.jsonl"
-        events_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(events_file, "a", encoding="utf-8", errors="backslashreplace") as f:
-            f.write(json.dumps(event) + "\n")
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(events_file, flags, 0o644)
+        except FileNotFoundError:
+            # sessions/ normally exists already (load_state creates it); only mkdir when it doesn't
+            events_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(events_file, flags, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
     except Exception:
         # Best-effort only; never block on analytics
         pass
@@ -202,7 +247,7 @@ def block_with_permission_reason(tool_name: str, reason: str, remediation: str,
             "blockedTool": tool_name
         }
     }
-    print(json.dumps(output), file=sys.stdout)
+    emit(output)
     
     _append_event({
         "type": "tool_blocked",
@@ -227,24 +272,13 @@ def is_work_artifact_path(file_path: Optional[Path]) -> bool:
     # Convert to string for easier checking
     path_str = str(file_path)
     
-    # Allowed directories for work artifacts
-    allowed_prefixes = [
-        'sessions/',
-        '.claude/',
-        'docs/',
-        'plans/',
-        'notes/',
-        'logs/',
-    ]
-    
     # Check if path starts with any allowed prefix (relative to project root)
     try:
         rel_path = file_path.relative_to(PROJECT_ROOT) if file_path.is_absolute() else file_path
-        rel_path_str = str(rel_path)
-        return any(rel_path_str.startswith(prefix) for prefix in allowed_prefixes)
+        return str(rel_path).startswith(WORK_ARTIFACT_PREFIXES)
     except (ValueError, AttributeError):
         # If we can't determine relative path, check the string directly
-        return any(prefix in path_str for prefix in allowed_prefixes)
+        return any(prefix in path_str for prefix in WORK_ARTIFACT_PREFIXES)
 
 def check_command_arguments(parts):
     """Check if command arguments indicate write operations"""
@@ -263,9 +297,7 @@ def check_command_arguments(parts):
     if cmd in ['awk', 'gawk', 'mawk']:
         script = ' '.join(args)
         # Check for output redirection within awk script
-        if re.search(r'>\s*["\'].*["\']', script):  # > "file" or > 'file'
-            return False
-        if re.search(r'>>\s*["\'].*["\']', script):  # >> "file" or >> 'file'
+        if AWK_FILE_OUTPUT.search(script):
             return False
         if 'print >' in script or 'print >>' in script:
             return False
@@ -283,15 +315,13 @@ def check_command_arguments(parts):
             if i + 1 >= len(args):
                 continue
             exec_cmd = args[i + 1].lower()
-            dangerous_cmds = WRITE_FIRST | {'rm', 'mv', 'cp', 'shred'}
-            if exec_cmd in dangerous_cmds:
+            if exec_cmd in FIND_EXEC_WRITE:
                 return False
 
     # Check xargs for dangerous commands
     if cmd == 'xargs':
-        for write_cmd in WRITE_FIRST:
-            if write_cmd in args:
-                return False
+        if not WRITE_FIRST.isdisjoint(args):
+            return False
         # Check for sed -i through xargs
         if 'sed' in args:
             sed_idx = args.index('sed')
@@ -300,6 +330,77 @@ def check_command_arguments(parts):
 
     return True
 
+def split_pipeline(command: str) -> Optional[list]:
+    """Split a command on |, && and || that sit outside quotes.
+
+    Single pass over the string; a `|` inside '...' or "...", or after a backslash, is
+    part of the segment rather than a separator. Returns None if the command contains a
+    command or process substitution (`...`, $(...), <(...) or >(...) outside single quotes):
+    the substituted commands run as well, so the command cannot be judged segment by segment.
+    """
+    segments = []
+    start = i = 0
+    n = len(command)
+    quote = None
+    while i < n:
+        ch = command[i]
+        if quote:
+            if ch == '\\' and quote != "'":
+                i += 2
+                continue
+            if ch == quote: quote = None
+            elif quote == '"' and (ch == '`' or (ch in '$<>' and command.startswith('(', i + 1))): return None
+        elif ch == '\\':
+            i += 2
+            continue
+        elif ch == '`' or (ch in '$<>' and command.startswith('(', i + 1)):
+            return None
+        elif ch in '\'"':
+            quote = ch
+        elif ch == '|' or (ch == '&' and command.startswith('&', i + 1)):
+            segments.append(command[start:i])
+            # || and && are two characters wide
+            i += 2 if command.startswith(ch, i + 1) else 1
+            start = i
+            continue
+        i += 1
+    segments.append(command[start:])
+    return segments
+
+def is_segment_read_only(parts, extrasafe: bool) -> bool:
+    """Check one tokenized pipeline segment; False means it is write-like."""
+    if not parts: return True
+
+    first = parts[0].lower()
+    if first == 'cd': return True
+
+    # Special case: Commands with read-only subcommands
+    if first in ['pip', 'pip3']:
+        subcommand = parts[1].lower() if len(parts) > 1 else ''
+        # Allow read-only pip operations, block write operations
+        return subcommand in ['show', 'list', 'search', 'check', 'freeze', 'help']
+
+    if first in ['npm', 'yarn']:
+        subcommand = parts[1].lower() if len(parts) > 1 else ''
+        # Allow read-only npm/yarn operations, block write operations
+        return subcommand in ['list', 'ls', 'view', 'show', 'search', 'help']
+
+    if first in ['python', 'python3']:
+        # Allow python -c for simple expressions and python -m for module execution
+        # (typically read-only operations in our context); block other invocations
+        return len(parts) > 1 and parts[1] in ['-c', '-m']
+
+    if first in WRITE_FIRST: return False
+
+    # Check command arguments for write operations
+    if not check_command_arguments(parts): return False
+
+    # Check if command is in user's custom readonly list
+    if first in CONFIG.blocked_actions.bash_read_patterns: return True  # Allow custom readonly commands
+
+    # If extrasafe is on and command not in readonly list, block it
+    return first in READONLY_FIRST or not extrasafe
+
 # Check if a bash command is read-only (no writes, no redirections)
 def is_bash_read_only(command: str, extrasafe: bool = CONFIG.blocked_actions.extrasafe or True) -> bool:
     """Determine if a bash command is read-only.
@@ -322,7 +423,17 @@ def is_bash_read_only(command: str, extrasafe: bool = CONFIG.blocked_actions.ext
     if REDIR.search(s):
         return False
 
-    for segment in re.split(r'(?<!\|)\|(?!\|)|&&|\|\|', s):  # Split on |, && and ||
+    # Fast path: with no pipes, && / ||, quoting or substitution there is exactly one segment and
+    # shlex.split would only split on whitespace, so skip both
+    if not NEEDS_FULL_PARSE.search(s):
+        return is_segment_read_only(s.split(), extrasafe)
+
+    segments = split_pipeline(s)
+    # Command substitutions run commands of their own; never treat them as read-only
+    if segments is None: return False
+
+    import shlex
+    for segment in segments:
         segment = segment.strip()
         if not segment: continue
         try:
@@ -330,40 +441,7 @@ def is_bash_read_only(command: str, extrasafe: bool = CONFIG.blocked_actions.ext
         except ValueError:
             return not extrasafe
         if not parts: continue
-
-        first = parts[0].lower()
-        if first == 'cd': continue
-
-        # Special case: Commands with read-only subcommands
-        if first in ['pip', 'pip3']:
-            subcommand = parts[1].lower() if len(parts) > 1 else ''
-            if subcommand in ['show', 'list', 'search', 'check', 'freeze', 'help']:
-                continue  # Allow read-only pip operations
-            return False  # Block write operations
-
-        if first in ['npm', 'yarn']:
-            subcommand = parts[1].lower() if len(parts) > 1 else ''
-            if subcommand in ['list', 'ls', 'view', 'show', 'search', 'help']:
-                continue  # Allow read-only npm/yarn operations
-            return False  # Block write operations
-
-        if first in ['python', 'python3']:
-            # Allow python -c for simple expressions and python -m for module execution
-            if len(parts) > 1 and parts[1] in ['-c', '-m']:
-                continue  # These are typically read-only operations in our context
-            # Block other python invocations as potentially write-like
-            return False
-
-        if first in WRITE_FIRST: return False
-
-        # Check command arguments for write operations
-        if not check_command_arguments(parts): return False
-
-        # Check if command is in user's custom readonly list
-        if first in CONFIG.blocked_actions.bash_read_patterns: continue  # Allow custom readonly commands
-
-        # If extrasafe is on and command not in readonly list, block it
-        if first not in READONLY_FIRST and extrasafe: return False
+        if not is_segment_read_only(parts, extrasafe): return False
 
     return True
 ##-##
@@ -377,7 +455,7 @@ if is_ci_environment():
     sys.exit(0)
 
 # Plan mode entry
-if tool_name == CCTools.PLAN.value and not getattr(STATE.flags, "bypass_mode", False):
+if tool_name == PLAN_TOOL and not getattr(STATE.flags, "bypass_mode", False):
     with edit_state() as s:
         try:
             current_mode = s.mode if isinstance(s.mode, Mode) else Mode(s.mode)
@@ -400,7 +478,7 @@ if tool_name == CCTools.PLAN.value and not getattr(STATE.flags, "bypass_mode", F
     sys.exit(0)
 
 # Plan mode exit
-if tool_name == CCTools.EXITPLANMODE.value and not getattr(STATE.flags, "bypass_mode", False):
+if tool_name == EXIT_PLAN_TOOL and not getattr(STATE.flags, "bypass_mode", False):
     with edit_state() as s:
         prev_mode_value = s.metadata.pop('plan_prev_mode', Mode.NO.value)
         stashed_count = s.metadata.pop('plan_stashed_count', 0)
@@ -423,7 +501,7 @@ if tool_name == CCTools.EXITPLANMODE.value and not getattr(STATE.flags, "bypass_
 
 #!> Bash command handling
 # For Bash commands, check if it's a read-only operation
-if tool_name == "Bash" and STATE.mode in (Mode.NO, Mode.PLAN) and not STATE.flags.bypass_mode:
+if tool_name == "Bash" and STATE.mode in PLANNING_MODES and not STATE.flags.bypass_mode:
     # Special case: Allow sessions.api commands in discussion mode
     if command and ('sessions ' in command or 'python -m cc_sessions.scripts.api' in command):
         # API commands are allowed in discussion mode for state inspection and safe config operations
@@ -462,9 +540,9 @@ if file_path and all([
 # --- All commands beyond here contain write patterns (read patterns exit early) ---
 
 #!> Discussion/plan mode guard (block write tools)
-if STATE.mode in (Mode.NO, Mode.PLAN) and not STATE.flags.bypass_mode:
+if STATE.mode in PLANNING_MODES and not STATE.flags.bypass_mode:
     # Allow work artifact writes (plans, logs, docs) in Plan/Discussion modes
-    if tool_name in ["Write", "Edit", "MultiEdit"] and is_work_artifact_path(file_path):
+    if tool_name in ARTIFACT_WRITE_TOOLS and is_work_artifact_path(file_path):
         print(f"[{STATE.mode.value.title()} Mode] Allowing {tool_name} for work artifact: {file_path}", file=sys.stderr)
         _append_event({
             "type": "tool_allowed",
@@ -491,10 +569,12 @@ if STATE.mode in (Mode.NO, Mode.PLAN) and not STATE.flags.bypass_mode:
 if tool_name == "TodoWrite" and not STATE.flags.bypass_mode:
     # Check for name mismatch first (regardless of completion state)
     if STATE.todos.active:
-        active_names = STATE.todos.list_content('active')
-        incoming_names = [t.get('content','') for t in incoming_todos]
+        # Compare names pairwise; stops at the first mismatch without building either list
+        active_todos = STATE.todos.active
+        names_changed = len(active_todos) != len(incoming_todos) or any(
+            a.content != t.get('content','') for a, t in zip(active_todos, incoming_todos))
 
-        if active_names != incoming_names:
+        if names_changed:
             # Todo names changed - safety violation
             with edit_state() as s: s.todos.clear_active(); s.mode = Mode.NO; STATE = s
             print("[DAIC: Blocked] Todo list changed - this violates agreed execution boundaries. "
@@ -513,7 +593,7 @@ if tool_name == "TodoWrite" and not STATE.flags.bypass_mode:
 if not file_path: sys.exit(0) # No file path, allow to proceed
 
 # Block direct modification of state file via Write/Edit/MultiEdit
-if all([    tool_name in ["Write", "Edit", "MultiEdit", "NotebookEdit"],
+if all([    tool_name in STATE_FILE_WRITE_TOOLS,
             file_path.name == 'sessions-state.json',
             file_path.parent.name == 'sessions',
             not STATE.flags.bypass_mode]):
@@ -533,68 +613,73 @@ else:
     repo_path = find_git_repo(file_path.parent)
 
     if repo_path:
-        try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=str(repo_path),
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            current_branch = result.stdout.strip()
-
-            # Extract the submodule name from the repo path
-            submodule_name = repo_path.name
-
-            # Check both conditions: branch status and task inclusion
-            branch_correct = (current_branch == expected_branch)
-            in_task = (STATE.current_task.submodules and submodule_name in STATE.current_task.submodules)
-            if repo_path == PROJECT_ROOT: in_task = True # Root repo - always considered in task
-
-            # Scenario 1: Everything is correct - allow to proceed
-            if in_task and branch_correct:
-                pass
-
-            # Scenario 2: Submodule is in task but on wrong branch
-            elif in_task and not branch_correct:
-                print(f"[Branch Mismatch] Submodule '{submodule_name}' is part of this task but is on branch '{current_branch}' instead of '{expected_branch}'.", file=sys.stderr)
-                print(f"Please run: cd {repo_path.relative_to(PROJECT_ROOT)} && git checkout {expected_branch}", file=sys.stderr)
-                _append_event({
-                    "type": "branch_mismatch",
-                    "service": submodule_name,
-                    "expected": expected_branch,
-                    "actual": current_branch,
-                })
-                sys.exit(2)
-
-            # Scenario 3: Submodule not in task but already on correct branch
-            elif not in_task and branch_correct:
-                print(f"[Submodule Not in Task] Submodule '{submodule_name}' is on the correct branch '{expected_branch}' but is not listed in the task file.", file=sys.stderr)
-                print(f"Please update the task file to include '{submodule_name}' in the submodules list.", file=sys.stderr)
-                _append_event({
-                    "type": "service_not_in_task",
-                    "service": submodule_name,
-                    "branch": current_branch,
-                })
-                sys.exit(2)
-
-            # Scenario 4: Submodule not in task AND on wrong branch
-            else:
-                print(f"[Submodule Not in Task + Wrong Branch] Submodule '{submodule_name}' has two issues:", file=sys.stderr)
-                print(f"  1. Not listed in the task file's submodules", file=sys.stderr)
-                print(f"  2. On branch '{current_branch}' instead of '{expected_branch}'", file=sys.stderr)
-                print(f"To fix: cd {repo_path.relative_to(PROJECT_ROOT)} && git checkout -b {expected_branch}", file=sys.stderr)
-                print(f"Then update the task file to include '{submodule_name}' in the submodules list.", file=sys.stderr)
-                _append_event({
-                    "type": "service_not_in_task_and_wrong_branch",
-                    "service": submodule_name,
-                    "expected": expected_branch,
-                    "actual": current_branch,
-                })
-                sys.exit(2)
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-            # Can't check branch, allow to proceed but warn
-            print(f"Warning: Could not verify branch for {repo_path.name}: {e}", file=sys.stderr)
+        # Read HEAD directly; only ask git (and import subprocess) when the file can't be interpreted
+        current_branch = read_git_branch(repo_path)
+        if current_branch is None:
+            import subprocess
+            try:
+                result = subprocess.run(
+                    ["git", "branch", "--show-current"],
+                    cwd=str(repo_path),
+                    capture_output=True,
+                    text=True,
+                    timeout=2
+                )
+                current_branch = result.stdout.strip()
+            except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
+                # Can't check branch, allow to proceed but warn
+                print(f"Warning: Could not verify branch for {repo_path.name}: {e}", file=sys.stderr)
+                sys.exit(0)
+
+        # Extract the submodule name from the repo path
+        submodule_name = repo_path.name
+
+        # Check both conditions: branch status and task inclusion
+        branch_correct = (current_branch == expected_branch)
+        in_task = (STATE.current_task.submodules and submodule_name in STATE.current_task.submodules)
+        if repo_path == PROJECT_ROOT: in_task = True # Root repo - always considered in task
+
+        # Scenario 1: Everything is correct - allow to proceed
+        if in_task and branch_correct:
+            pass
+
+        # Scenario 2: Submodule is in task but on wrong branch
+        elif in_task and not branch_correct:
+            print(f"[Branch Mismatch] Submodule '{submodule_name}' is part of this task but is on branch '{current_branch}' instead of '{expected_branch}'.", file=sys.stderr)
+            print(f"Please run: cd {repo_path.relative_to(PROJECT_ROOT)} && git checkout {expected_branch}", file=sys.stderr)
+            _append_event({
+                "type": "branch_mismatch",
+                "service": submodule_name,
+                "expected": expected_branch,
+                "actual": current_branch,
+            })
+            sys.exit(2)
+
+        # Scenario 3: Submodule not in task but already on correct branch
+        elif not in_task and branch_correct:
+            print(f"[Submodule Not in Task] Submodule '{submodule_name}' is on the correct branch '{expected_branch}' but is not listed in the task file.", file=sys.stderr)
+            print(f"Please update the task file to include '{submodule_name}' in the submodules list.", file=sys.stderr)
+            _append_event({
+                "type": "service_not_in_task",
+                "service": submodule_name,
+                "branch": current_branch,
+            })
+            sys.exit(2)
+
+        # Scenario 4: Submodule not in task AND on wrong branch
+        else:
+            print(f"[Submodule Not in Task + Wrong Branch] Submodule '{submodule_name}' has two issues:", file=sys.stderr)
+            print(f"  1. Not listed in the task file's submodules", file=sys.stderr)
+            print(f"  2. On branch '{current_branch}' instead of '{expected_branch}'", file=sys.stderr)
+            print(f"To fix: cd {repo_path.relative_to(PROJECT_ROOT)} && git checkout -b {expected_branch}", file=sys.stderr)
+            print(f"Then update the task file to include '{submodule_name}' in the submodules list.", file=sys.stderr)
+            _append_event({
+                "type": "service_not_in_task_and_wrong_branch",
+                "service": submodule_name,
+                "expected": expected_branch,
+                "actual": current_branch,
+            })
+            sys.exit(2)
 #!<
 
 #-#
@@ -16,6 +16,11 @@ from enum import Enum
 ##-##
 
 ## ===== 3RD-PARTY ===== ##
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 ##-##
 
 ## ===== LOCAL ===== ##
@@ -658,6 +663,30 @@ class SessionsState:
 
 # ===== FUNCTIONS ===== #
 
+## ===== HOOK I/O ===== ##
+def read_hook_input() -> Any:
+    """Parse the JSON payload Claude Code sends a hook on stdin."""
+    if ORJSON_AVAILABLE and hasattr(sys.stdin, 'buffer'): return orjson.loads(sys.stdin.buffer.read())
+    return json.load(sys.stdin)
+
+def json_line(obj: Any) -> bytes:
+    """Serialize obj as one newline-terminated UTF-8 JSON line, via orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        # orjson refuses lone surrogates; the stdlib path below escapes them instead
+        with suppress(TypeError): return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode("utf-8", "backslashreplace")
+
+def emit(payload: dict) -> None:
+    """Write a hook's JSON output to stdout."""
+    if hasattr(sys.stdout, 'buffer'):
+        # Write the UTF-8 bytes raw so non-ASCII text never meets a legacy console codec
+        sys.stdout.flush()
+        sys.stdout.buffer.write(json_line(payload))
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(payload))
+##-##
+
 ## ===== HELPERS ===== ##
 def find_git_repo(dir_path: Path) -> Optional[Path]:
     """Walk up directory tree to find .git directory.
@@ -673,6 +702,28 @@ def find_git_repo(dir_path: Path) -> Optional[Path]:
         current = current.parent
     return None
 
+def read_git_branch(repo_path: Path) -> Optional[str]:
+    """Read the checked-out branch from the repo's HEAD file without spawning git.
+
+    Returns '' for a detached HEAD (as `git branch --show-current` does) and None when
+    HEAD can't be interpreted, so callers can fall back to asking git.
+    """
+    git_path = repo_path / '.git'
+    try:
+        try: head = (git_path / 'HEAD').read_text(encoding='utf-8')
+        except NotADirectoryError:
+            # Worktrees and submodules: .git is a file holding "gitdir: <path>"
+            pointer = git_path.read_text(encoding='utf-8').strip()
+            if not pointer.startswith('gitdir:'): return None
+            head = (repo_path / pointer[7:].strip() / 'HEAD').read_text(encoding='utf-8')
+    except OSError: return None
+    head = head.strip()
+    if not head.startswith('ref: '): return ''  # Detached HEAD
+    branch = head[len('ref: refs/heads/'):] if head.startswith('ref: refs/heads/') else None
+    # Reftable repos keep a placeholder HEAD; only git itself knows the branch
+    if branch == '.invalid': return None
+    return branch
+
 def _normalize_task_path(task_path: Union[str, Path]) -> str:
     """Normalize task path to relative string from sessions/tasks/.
     Strips absolute path prefix if present."""
@@ -876,12 +927,17 @@ def _lock(lock_dir: Path, timeout: float = 1.0, poll: float = 0.05, stale_timeou
 ##-##
 
 ## ===== GEIPI ===== ##
+def _read_json(path: Path) -> Any:
+    # Every hook parses state and config on startup; orjson decodes the raw bytes in C when installed
+    raw = path.read_bytes()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
 def load_state() -> SessionsState:
     if not STATE_FILE.exists():
         initial = SessionsState()
         _the_ol_in_out(STATE_FILE, initial.to_dict())
         return initial
-    try: data = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    try: data = _read_json(STATE_FILE)
     except json.JSONDecodeError:
         # Corrupt file: back it up once and start fresh
         backup = STATE_FILE.with_suffix(".bad.json")
@@ -896,7 +952,7 @@ def load_config() -> SessionsConfig:
         initial = SessionsConfig()
         _the_ol_in_out(CONFIG_FILE, initial.to_dict())
         return initial
-    try: data = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+    try: data = _read_json(CONFIG_FILE)
     except json.JSONDecodeError:
         # Corrupt file: back it up once and start fresh
         backup = CONFIG_FILE.with_suffix(".bad.json")
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """
 Basic integration tests for cc-sessions consolidated hooks
+
+Standalone runner (python test_hooks.py) for the pre-0.4 hook scripts under
+cc_sessions/hooks/. It is not collected by pytest; the suite lives in tests/.
 """
 
 import json
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 
 
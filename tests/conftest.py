@@ -0,0 +1,30 @@
+"""Shared fixtures for the hook tests."""
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+# Hook modules import each other as top-level scripts (`from shared_state import ...`), so tests
+# that import them directly need the hooks directory on sys.path. It is added once per session;
+# those tests still import lazily, so a broken hook fails its own tests rather than collection.
+HOOKS_DIR = str(Path(__file__).resolve().parents[1] / "cc_sessions" / "python" / "hooks")
+if HOOKS_DIR not in sys.path:
+    sys.path.insert(0, HOOKS_DIR)
+
+
+@pytest.fixture
+def run_hook():
+    """Run a hook script as __main__ in this interpreter, as `python3 script` would from cwd.
+
+    Saves an interpreter start per case. Uses the plugin adapter's in-process runner, so
+    the tests exercise the same stdio/argv/cwd/env handling and shared_state reset.
+    """
+    from cc_sessions.plugin.enforcement_plugin import _exec_hook
+
+    def run(script: Path, cwd: Path, stdin: str = "{}", env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+        returncode, stdout, stderr = _exec_hook(script, stdin, cwd, env)
+        return subprocess.CompletedProcess([sys.executable, str(script)], returncode, stdout, stderr)
+
+    return run
@@ -0,0 +1,67 @@
+"""Tests for the workspace-aware SharedState in .claude/hooks/shared_state.py."""
+import importlib.util
+import json
+import time
+from pathlib import Path
+
+
+def repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+def load_module():
+    # Loaded under its own name: the package hooks' shared_state is also importable as `shared_state`
+    path = repo_root() / ".claude" / "hooks" / "shared_state.py"
+    spec = importlib.util.spec_from_file_location("claude_hooks_shared_state", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_state(tmp: Path, monkeypatch):
+    (tmp / ".claude").mkdir()
+    monkeypatch.chdir(tmp)
+    return load_module().SharedState()
+
+
+def test_get_workspace_tasks_newest_first_and_skips_bad_files(tmp_path: Path, monkeypatch):
+    state = make_state(tmp_path, monkeypatch)
+    tasks_dir = state.workspace_state_dir / "workspace_tasks"
+    for name, created_at in [
+        ("workspace_20240101_000000.json", "2024-01-01T00:00:00"),
+        ("workspace_20250101_000000.json", "2025-01-01T00:00:00"),
+        ("imported-task.json", "2024-06-01T00:00:00"),
+    ]:
+        (tasks_dir / name).write_text(json.dumps({"id": name[:-5], "created_at": created_at}))
+    (tasks_dir / "workspace_20230101_000000.json").write_text("{not json")
+    (tasks_dir / "workspace_20260101_000000.json.tmp").write_text(json.dumps({"id": "tmp", "created_at": "2026"}))
+
+    ids = [task["id"] for task in state.get_workspace_tasks()]
+
+    assert ids == ["workspace_20250101_000000", "imported-task", "workspace_20240101_000000"]
+
+
+def test_create_cross_repo_task_writes_atomically(tmp_path: Path, monkeypatch):
+    state = make_state(tmp_path, monkeypatch)
+
+    task = state.create_cross_repo_task("Shared", "desc", [str(tmp_path / "repo-a")])
+
+    task_file = state.workspace_state_dir / "workspace_tasks" / f"{task['id']}.json"
+    assert json.loads(task_file.read_text())["name"] == "Shared"
+    assert not list(task_file.parent.glob("*.tmp"))
+
+
+def test_cooldown_uses_expires_ts_with_iso_fallback(tmp_path: Path, monkeypatch):
+    state = make_state(tmp_path, monkeypatch)
+
+    state.set_daic_mode("implementation")
+    data = json.loads(state.daic_cooldown_file.read_text())
+    assert data["expires_ts"] > time.time()
+    assert state.is_in_cooldown()
+
+    state.daic_cooldown_file.write_text(json.dumps({"expires_ts": time.time() - 1}))
+    assert not state.is_in_cooldown()
+
+    # Files written before expires_ts existed only carry the ISO string
+    state.daic_cooldown_file.write_text(json.dumps({"expires_at": "2999-01-01T00:00:00"}))
+    assert state.is_in_cooldown()
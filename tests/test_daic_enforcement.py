@@ -2,19 +2,30 @@ import json
 import subprocess
 from pathlib import Path
 
+import pytest
+
 
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def run_enforce(tmp: Path, payload: dict) -> subprocess.CompletedProcess:
-    script = repo_root() / "cc_sessions" / "python" / "hooks" / "sessions_enforce.py"
-    return subprocess.run(["python3", str(script)], input=json.dumps(payload), text=True, capture_output=True, cwd=str(tmp), timeout=10)
+ENFORCE_SCRIPT = repo_root() / "cc_sessions" / "python" / "hooks" / "sessions_enforce.py"
+
+
+@pytest.fixture
+def run_enforce(run_hook):
+    def run(tmp: Path, payload: dict) -> subprocess.CompletedProcess:
+        return run_hook(ENFORCE_SCRIPT, tmp, stdin=json.dumps(payload))
+    return run
+
+
+def run_enforce_subprocess(tmp: Path, payload: dict) -> subprocess.CompletedProcess:
+    return subprocess.run(["python3", str(ENFORCE_SCRIPT)], input=json.dumps(payload), text=True, capture_output=True, cwd=str(tmp), timeout=10)
 
 
 def setup_discussion(tmp: Path) -> None:
-    (tmp / ".claude").mkdir(parents=True, exist_ok=True)
-    (tmp / "sessions").mkdir(parents=True, exist_ok=True)
+    for d in (tmp / ".claude", tmp / "sessions"):
+        d.mkdir()
     state = {
         "model": "opus",
         "mode": "discussion",
@@ -33,7 +44,7 @@ def write_state(tmp: Path, state: dict) -> None:
     (tmp / "sessions" / "sessions-state.json").write_text(json.dumps(state))
 
 
-def test_block_write_tool_in_discussion(tmp_path: Path):
+def test_block_write_tool_in_discussion(tmp_path: Path, run_enforce):
     setup_discussion(tmp_path)
     payload = {"tool_name": "Write", "tool_input": {"file_path": "x.py"}}
     res = run_enforce(tmp_path, payload)
@@ -41,152 +52,155 @@ def test_block_write_tool_in_discussion(tmp_path: Path):
     assert "DAIC: Tool Blocked" in (res.stderr or "")
 
 
-def test_allow_readonly_bash_in_discussion(tmp_path: Path):
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "ls"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 0
-
-
-# Comprehensive DAIC enforcement matrix tests
-def test_allow_cat_in_discussion(tmp_path: Path):
-    """cat README.md → allowed (exit 0)"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "cat README.md"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 0
-
-
-def test_block_sed_inplace_in_discussion(tmp_path: Path):
-    """sed -i 's/a/b/' file → blocked (exit 2)"""
+def test_block_write_tool_in_discussion_as_script(tmp_path: Path):
+    """Same check through a real `python3 sessions_enforce.py` process"""
     setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "sed -i 's/a/b/' file.txt"}}
-    res = run_enforce(tmp_path, payload)
+    payload = {"tool_name": "Write", "tool_input": {"file_path": "x.py"}}
+    res = run_enforce_subprocess(tmp_path, payload)
     assert res.returncode == 2
-    assert "write-like" in (res.stderr or "").lower()
-
-
-def test_block_awk_output_redirect_in_discussion(tmp_path: Path):
-    """awk '{print > "out"}' file → blocked"""
+    assert "DAIC: Tool Blocked" in (res.stderr or "")
+    assert json.loads(res.stdout)["hookSpecificOutput"]["blockedTool"] == "Write"
+
+
+# Comprehensive DAIC enforcement matrix: bash command in discussion mode → exit code
+BASH_DISCUSSION_MATRIX = [
+    pytest.param("ls", 0, id="ls"),
+    pytest.param("cat README.md", 0, id="cat"),
+    pytest.param("sed -i 's/a/b/' file.txt", 2, id="sed-inplace"),
+    pytest.param("awk '{print > \"out\"}' input.txt", 2, id="awk-output-redirect"),
+    # Spaces between > / >> and the filename (regression for the \s* pattern)
+    pytest.param("awk '{print >  \"out\"}' input.txt", 2, id="awk-output-redirect-spaces"),
+    pytest.param("awk '{print >>    \"out\"}' input.txt", 2, id="awk-append-redirect-spaces"),
+    pytest.param("find . -name '*.tmp' -delete", 2, id="find-delete"),
+    pytest.param("find . -name '*.tmp' -exec rm {} +", 2, id="find-exec-rm"),
+    pytest.param("printf 'file1\\nfile2\\n' | xargs rm", 2, id="xargs-rm"),
+    pytest.param("cat file.txt | grep pattern | sort", 0, id="readonly-compound"),
+    pytest.param("cat filelist.txt | xargs rm", 2, id="write-after-pipe"),
+    pytest.param("echo 'hello' > output.txt", 2, id="echo-redirect"),
+    pytest.param("echo 'hello world'", 0, id="echo-stdout"),
+    pytest.param("cp file1.txt file2.txt", 2, id="cp"),
+    pytest.param("mv file1.txt file2.txt", 2, id="mv"),
+    # A quoted | or && is not a separator, but a real one after it still is
+    pytest.param("grep 'foo|bar' README.md", 0, id="quoted-pipe"),
+    pytest.param('echo "a && b" && rm x', 2, id="write-after-quoted-operator"),
+    # Command substitution runs its own commands, whatever the outer command is
+    pytest.param("echo `cat list | xargs rm`", 2, id="backtick-substitution"),
+    pytest.param("echo $(rm x)", 2, id="dollar-substitution"),
+    pytest.param('echo "files: $(ls)"', 2, id="substitution-in-double-quotes"),
+    pytest.param("grep '$(x)' README.md", 0, id="single-quoted-substitution-literal"),
+    pytest.param("cat <(rm x)", 2, id="process-substitution-in"),
+    pytest.param("diff <(ls) >(rm x)", 2, id="process-substitution-out"),
+    # Arithmetic expansion shares the $( prefix; blocking it is deliberately conservative
+    pytest.param("echo $((1+2))", 2, id="arithmetic-expansion"),
+]
+
+
+@pytest.mark.parametrize("command,returncode", BASH_DISCUSSION_MATRIX)
+def test_bash_in_discussion(tmp_path: Path, command: str, returncode: int, run_enforce):
+    setup_discussion(tmp_path)
+    payload = {"tool_name": "Bash", "tool_input": {"command": command}}
+    res = run_enforce(tmp_path, payload)
+    assert res.returncode == returncode
+    if returncode == 2:
+        assert "write-like" in (res.stderr or "").lower()
+
+
+def test_plan_mode_round_trip(tmp_path: Path, run_enforce):
     setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "awk '{print > \"out\"}' input.txt"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 2
+    # Seed an active todo so we can confirm it is stashed/restored
+    state = read_state(tmp_path)
+    state.setdefault("todos", {})
+    state["todos"]["active"] = [{"content": "Draft plan", "status": "pending"}]
+    write_state(tmp_path, state)
 
+    # Enter plan mode
+    res = run_enforce(tmp_path, {"tool_name": "Plan", "tool_input": {}})
+    assert res.returncode == 0
+    state = read_state(tmp_path)
+    assert state["mode"] == "plan"
+    assert state.get("metadata", {}).get("plan_prev_mode") == "discussion"
+    assert state["todos"].get("active", []) == []
+    assert state["todos"].get("stashed", [])
 
-def test_block_awk_output_redirect_with_spaces(tmp_path: Path):
-    """awk '{print > "out"}' file → blocked (tests regex fix for \s* pattern)"""
-    setup_discussion(tmp_path)
-    # Test with spaces between > and filename (the bug case)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "awk '{print >  \"out\"}' input.txt"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 2
+    # Exit plan mode
+    res = run_enforce(tmp_path, {"tool_name": "ExitPlanMode", "tool_input": {}})
+    assert res.returncode == 0
+    state = read_state(tmp_path)
+    assert state["mode"] == "discussion"
+    assert "plan_prev_mode" not in state.get("metadata", {})
+    active_todos = state["todos"].get("active", [])
+    assert active_todos and active_todos[0]["content"] == "Draft plan"
 
 
-def test_block_awk_append_redirect_with_spaces(tmp_path: Path):
-    """awk '{print >> "out"}' file → blocked (tests regex fix for \s* pattern)"""
+def test_events_appended_one_line_per_run(tmp_path: Path, run_enforce):
     setup_discussion(tmp_path)
-    # Test with spaces between >> and filename (the bug case)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "awk '{print >>    \"out\"}' input.txt"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 2
+    run_enforce(tmp_path, {"tool_name": "Bash", "tool_input": {"command": "ls"}})
+    run_enforce(tmp_path, {"tool_name": "Write", "tool_input": {"file_path": "x.py"}})
 
+    lines = (tmp_path / "sessions" / "sessions-events.jsonl").read_text().splitlines()
+    events = [json.loads(line) for line in lines]
+    assert [e["type"] for e in events] == ["tool_allowed", "tool_blocked"]
+    assert all("timestamp" in e for e in events)
 
-def test_block_find_delete_in_discussion(tmp_path: Path):
-    """find . -delete → blocked"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "find . -name '*.tmp' -delete"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 2
 
-
-def test_block_find_exec_rm_in_discussion(tmp_path: Path):
-    """find . -exec rm {} + → blocked"""
+def test_branch_mismatch_read_from_git_head(tmp_path: Path, run_enforce):
+    """Write on the wrong branch in implementation mode → blocked (exit 2)"""
     setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "find . -name '*.tmp' -exec rm {} +"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 2
-
+    state = read_state(tmp_path)
+    state["mode"] = "implementation"
+    write_state(tmp_path, state)
+    subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True)
 
-def test_block_xargs_rm_in_discussion(tmp_path: Path):
-    """printf "a\n" | xargs rm → blocked"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "printf 'file1\\nfile2\\n' | xargs rm"}}
+    payload = {"tool_name": "Write", "tool_input": {"file_path": str(tmp_path / "x.py")}}
     res = run_enforce(tmp_path, payload)
     assert res.returncode == 2
+    assert "instead of 'feature/x'" in res.stderr
+    assert "branch 'main'" in res.stderr
 
-
-def test_allow_readonly_compound_in_discussion(tmp_path: Path):
-    """cat file | grep pattern | sort → allowed"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "cat file.txt | grep pattern | sort"}}
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/feature/x\n")
     res = run_enforce(tmp_path, payload)
     assert res.returncode == 0
 
 
-def test_block_write_after_pipe_in_discussion(tmp_path: Path):
-    """cat file | xargs rm → blocked"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "cat filelist.txt | xargs rm"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 2
-
-
-def test_block_echo_redirect_in_discussion(tmp_path: Path):
-    """echo "text" > file → blocked"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "echo 'hello' > output.txt"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 2
+def setup_implementation(tmp: Path, branch=None) -> None:
+    setup_discussion(tmp)
+    state = read_state(tmp)
+    state["mode"] = "implementation"
+    state["current_task"]["branch"] = branch
+    write_state(tmp, state)
 
 
-def test_allow_echo_stdout_in_discussion(tmp_path: Path):
-    """echo "text" without redirect → allowed"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "echo 'hello world'"}}
+def test_allow_write_in_implementation_without_task_branch(tmp_path: Path, run_enforce):
+    setup_implementation(tmp_path)
+    payload = {"tool_name": "Write", "tool_input": {"file_path": str(tmp_path / "x.py")}}
     res = run_enforce(tmp_path, payload)
     assert res.returncode == 0
+    assert not (tmp_path / "sessions" / "sessions-config.json").exists()
 
 
-def test_block_cp_in_discussion(tmp_path: Path):
-    """cp source dest → blocked"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "cp file1.txt file2.txt"}}
-    res = run_enforce(tmp_path, payload)
-    assert res.returncode == 2
-
-
-def test_block_mv_in_discussion(tmp_path: Path):
-    """mv source dest → blocked"""
-    setup_discussion(tmp_path)
-    payload = {"tool_name": "Bash", "tool_input": {"command": "mv file1.txt file2.txt"}}
+def test_block_state_file_write_in_implementation(tmp_path: Path, run_enforce):
+    setup_implementation(tmp_path)
+    payload = {"tool_name": "Write", "tool_input": {"file_path": str(tmp_path / "sessions" / "sessions-state.json")}}
     res = run_enforce(tmp_path, payload)
     assert res.returncode == 2
+    assert "sessions-state.json" in res.stderr
 
 
-def test_plan_mode_round_trip(tmp_path: Path):
-    setup_discussion(tmp_path)
-    # Seed an active todo so we can confirm it is stashed/restored
+def test_todowrite_name_change_returns_to_discussion(tmp_path: Path, run_enforce):
+    setup_implementation(tmp_path)
     state = read_state(tmp_path)
-    state.setdefault("todos", {})
-    state["todos"]["active"] = [{"content": "Draft plan", "status": "pending"}]
+    state["todos"]["active"] = [{"content": "a", "status": "pending"}, {"content": "b", "status": "pending"}]
     write_state(tmp_path, state)
 
-    # Enter plan mode
-    res = run_enforce(tmp_path, {"tool_name": "Plan", "tool_input": {}})
-    assert res.returncode == 0
-    state = read_state(tmp_path)
-    assert state["mode"] == "plan"
-    assert state.get("metadata", {}).get("plan_prev_mode") == "discussion"
-    assert state["todos"].get("active", []) == []
-    assert state["todos"].get("stashed", [])
+    same = {"tool_name": "TodoWrite", "tool_input": {"todos": [
+        {"content": "a", "status": "completed"}, {"content": "b", "status": "in_progress"}]}}
+    assert run_enforce(tmp_path, same).returncode == 0
+    assert read_state(tmp_path)["mode"] == "implementation"
 
-    # Exit plan mode
-    res = run_enforce(tmp_path, {"tool_name": "ExitPlanMode", "tool_input": {}})
-    assert res.returncode == 0
+    extended = {"tool_name": "TodoWrite", "tool_input": {"todos": [
+        {"content": "a"}, {"content": "b"}, {"content": "c"}]}}
+    res = run_enforce(tmp_path, extended)
+    assert res.returncode == 2
     state = read_state(tmp_path)
     assert state["mode"] == "discussion"
-    assert "plan_prev_mode" not in state.get("metadata", {})
-    active_todos = state["todos"].get("active", [])
-    assert active_todos and active_todos[0]["content"] == "Draft plan"
-
+    assert state["todos"].get("active", []) == []
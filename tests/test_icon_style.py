@@ -8,9 +8,15 @@ def repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+def setup_project(tmp: Path) -> None:
+    # tmp_path already exists and is empty, so each directory is a single mkdir
+    for d in (tmp / ".claude", tmp / "sessions"):
+        d.mkdir()
+
+
 def test_config_migration_nerd_fonts_true(tmp_path: Path):
     """Test migration: use_nerd_fonts=True → icon_style='nerd-fonts'"""
-    (tmp_path / "sessions").mkdir(parents=True, exist_ok=True)
+    (tmp_path / "sessions").mkdir()
     old_config = {
         "environment": {"developer_name": "developer", "os": "linux", "shell": "bash"},
         "features": {"use_nerd_fonts": True},
@@ -21,8 +27,6 @@ def test_config_migration_nerd_fonts_true(tmp_path: Path):
     (tmp_path / "sessions" / "sessions-config.json").write_text(json.dumps(old_config))
 
     # Import and load config
-    import sys
-    sys.path.insert(0, str(repo_root() / "cc_sessions" / "python" / "hooks"))
     from shared_state import load_config
 
     config = load_config(project_root=tmp_path)
@@ -31,7 +35,7 @@ def test_config_migration_nerd_fonts_true(tmp_path: Path):
 
 def test_config_migration_nerd_fonts_false(tmp_path: Path):
     """Test migration: use_nerd_fonts=False → icon_style='ascii'"""
-    (tmp_path / "sessions").mkdir(parents=True, exist_ok=True)
+    (tmp_path / "sessions").mkdir()
     old_config = {
         "environment": {"developer_name": "developer", "os": "linux", "shell": "bash"},
         "features": {"use_nerd_fonts": False},
@@ -42,8 +46,6 @@ def test_config_migration_nerd_fonts_false(tmp_path: Path):
     (tmp_path / "sessions" / "sessions-config.json").write_text(json.dumps(old_config))
 
     # Import and load config
-    import sys
-    sys.path.insert(0, str(repo_root() / "cc_sessions" / "python" / "hooks"))
     from shared_state import load_config
 
     config = load_config(project_root=tmp_path)
@@ -52,7 +54,7 @@ def test_config_migration_nerd_fonts_false(tmp_path: Path):
 
 def test_config_new_icon_style_field(tmp_path: Path):
     """Test new icon_style field works correctly"""
-    (tmp_path / "sessions").mkdir(parents=True, exist_ok=True)
+    (tmp_path / "sessions").mkdir()
     new_config = {
         "environment": {"developer_name": "developer", "os": "linux", "shell": "bash"},
         "features": {"icon_style": "unicode"},
@@ -63,8 +65,6 @@ def test_config_new_icon_style_field(tmp_path: Path):
     (tmp_path / "sessions" / "sessions-config.json").write_text(json.dumps(new_config))
 
     # Import and load config
-    import sys
-    sys.path.insert(0, str(repo_root() / "cc_sessions" / "python" / "hooks"))
     from shared_state import load_config
 
     config = load_config(project_root=tmp_path)
@@ -73,8 +73,7 @@ def test_config_new_icon_style_field(tmp_path: Path):
 
 def test_statusline_nerd_fonts_icons(tmp_path: Path):
     """Test statusline output with nerd-fonts icon_style"""
-    (tmp_path / ".claude").mkdir(parents=True, exist_ok=True)
-    (tmp_path / "sessions").mkdir(parents=True, exist_ok=True)
+    setup_project(tmp_path)
 
     config = {
         "environment": {"developer_name": "developer", "os": "linux", "shell": "bash"},
@@ -111,8 +110,7 @@ def test_statusline_nerd_fonts_icons(tmp_path: Path):
 
 def test_statusline_ascii_no_icons(tmp_path: Path):
     """Test statusline output with ascii icon_style"""
-    (tmp_path / ".claude").mkdir(parents=True, exist_ok=True)
-    (tmp_path / "sessions").mkdir(parents=True, exist_ok=True)
+    setup_project(tmp_path)
 
     config = {
         "environment": {"developer_name": "developer", "os": "linux", "shell": "bash"},
@@ -151,8 +149,7 @@ def test_statusline_ascii_no_icons(tmp_path: Path):
 
 def test_statusline_unicode_icons(tmp_path: Path):
     """Test statusline output with unicode icon_style"""
-    (tmp_path / ".claude").mkdir(parents=True, exist_ok=True)
-    (tmp_path / "sessions").mkdir(parents=True, exist_ok=True)
+    setup_project(tmp_path)
 
     config = {
         "environment": {"developer_name": "developer", "os": "linux", "shell": "bash"},
@@ -0,0 +1,101 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def read_settings(tmp: Path) -> dict:
+    return json.loads((tmp / ".claude" / "settings.json").read_text())
+
+
+def test_configure_settings_is_idempotent(tmp_path: Path):
+    from cc_sessions import install
+
+    (tmp_path / ".claude").mkdir()
+    install.configure_settings(tmp_path)
+    first = read_settings(tmp_path)
+    install.configure_settings(tmp_path)
+    second = read_settings(tmp_path)
+
+    assert second == first
+    assert len(second["hooks"]["PreToolUse"]) == 2
+
+
+def test_configure_settings_keeps_user_hooks_after_sessions_hooks(tmp_path: Path):
+    from cc_sessions import install
+
+    user_hook = {"matcher": "Bash", "hooks": [{"type": "command", "command": "echo mine"}]}
+    (tmp_path / ".claude").mkdir()
+    (tmp_path / ".claude" / "settings.json").write_text(
+        json.dumps({"model": "opus", "hooks": {"PreToolUse": [user_hook]}})
+    )
+
+    install.configure_settings(tmp_path)
+    install.configure_settings(tmp_path)
+    settings = read_settings(tmp_path)
+
+    assert settings["model"] == "opus"
+    pre = settings["hooks"]["PreToolUse"]
+    assert pre.count(user_hook) == 1
+    assert pre[-1] == user_hook
+    assert "sessions_enforce.py" in pre[0]["hooks"][0]["command"]
+
+
+def test_configure_settings_leaves_unchanged_file_alone(tmp_path: Path):
+    from cc_sessions import install
+
+    (tmp_path / ".claude").mkdir()
+    install.configure_settings(tmp_path)
+    settings_path = tmp_path / ".claude" / "settings.json"
+    os.utime(settings_path, ns=(0, 0))
+
+    install.configure_settings(tmp_path)
+
+    assert settings_path.stat().st_mtime_ns == 0
+
+
+def test_configure_gitignore_adds_kickstart_sentinel_once(tmp_path: Path):
+    from cc_sessions import install
+
+    (tmp_path / ".gitignore").write_text("node_modules/\nsessions/sessions-state.json\n")
+    install.configure_gitignore(tmp_path)
+    install.configure_gitignore(tmp_path)
+
+    lines = (tmp_path / ".gitignore").read_text().splitlines()
+    assert lines.count("sessions/.kickstart_done") == 1
+    assert lines.count("sessions/sessions-state.json") == 1
+
+
+def test_copy_file_skips_missing_source_but_not_missing_destination(tmp_path: Path):
+    from cc_sessions import install
+
+    install.copy_file(tmp_path / "absent.md", tmp_path / "out.md")
+    assert not (tmp_path / "out.md").exists()
+
+    src = tmp_path / "present.md"
+    src.write_text("x")
+    with pytest.raises(FileNotFoundError):
+        install.copy_file(src, tmp_path / "no-such-dir" / "present.md")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks and POSIX modes")
+def test_configure_settings_writes_through_symlink_and_keeps_mode(tmp_path: Path):
+    from cc_sessions import install
+
+    dotfiles = tmp_path / "dotfiles"
+    dotfiles.mkdir()
+    target = dotfiles / "settings.json"
+    target.write_text(json.dumps({"model": "opus"}))
+    os.chmod(target, 0o600)
+    (tmp_path / ".claude").mkdir()
+    link = tmp_path / ".claude" / "settings.json"
+    link.symlink_to(target)
+
+    install.configure_settings(tmp_path)
+
+    assert link.is_symlink()
+    assert json.loads(target.read_text())["hooks"]
+    assert os.stat(target).st_mode & 0o777 == 0o600
+    assert not list(dotfiles.glob("*.tmp")) and not list((tmp_path / ".claude").glob("*.tmp"))
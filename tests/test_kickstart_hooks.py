@@ -1,15 +1,29 @@
 import json
 import os
 import subprocess
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import pytest
+
 
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def run_kickstart_hook(tmp: Path) -> subprocess.CompletedProcess:
+KICKSTART_SCRIPT = repo_root() / "cc_sessions" / "python" / "hooks" / "kickstart_session_start.py"
+
+
+@pytest.fixture
+def run_kickstart_hook(run_hook):
+    """Run kickstart_session_start in-process; CLAUDE_PROJECT_DIR points find_project_root() at tmp."""
+    def run(tmp: Path) -> subprocess.CompletedProcess:
+        return run_hook(KICKSTART_SCRIPT, tmp, env={"CLAUDE_PROJECT_DIR": str(tmp)})
+    return run
+
+
+def run_kickstart_hook_subprocess(tmp: Path) -> subprocess.CompletedProcess:
     """Run kickstart_session_start hook and return result.
 
     The hook now uses find_project_root() from shared_state.py like other hooks,
@@ -76,7 +90,7 @@ def parse_hook_output(output: str) -> dict:
 
 # ===== PHASE 1: COMPLETION DETECTION TESTS =====
 
-def test_kickstart_completion_flag_exits_silently(tmp_path: Path):
+def test_kickstart_completion_flag_exits_silently(tmp_path: Path, run_kickstart_hook):
     """Phase 1: Hook exits silently when onboarding_complete is true."""
     kickstart_meta = {
         "mode": "full",
@@ -94,7 +108,34 @@ def test_kickstart_completion_flag_exits_silently(tmp_path: Path):
     assert not res.stderr.strip()
 
 
-def test_kickstart_missing_metadata_with_hook_file_exits_silently(tmp_path: Path):
+def test_kickstart_completion_flag_writes_sentinel(tmp_path: Path, run_kickstart_hook):
+    """Completed onboarding leaves a sentinel so later sessions skip loading state."""
+    setup_kickstart_state(tmp_path, {"mode": "full", "onboarding_complete": True})
+
+    res = run_kickstart_hook(tmp_path)
+    assert res.returncode == 0
+    assert (tmp_path / "sessions" / ".kickstart_done").exists()
+
+
+def test_kickstart_sentinel_exits_before_reading_state(tmp_path: Path, run_kickstart_hook):
+    """Sentinel short-circuits the hook even when metadata says kickstart is active."""
+    kickstart_meta = {
+        "mode": "full",
+        "sequence": ["01-discussion.md"],
+        "current_index": 0,
+        "completed": []
+    }
+    setup_kickstart_state(tmp_path, kickstart_meta)
+    (tmp_path / "sessions" / ".kickstart_done").touch()
+    before = read_state(tmp_path)
+
+    res = run_kickstart_hook(tmp_path)
+    assert res.returncode == 0
+    assert not res.stdout.strip()
+    assert read_state(tmp_path) == before
+
+
+def test_kickstart_missing_metadata_with_hook_file_exits_silently(tmp_path: Path, run_kickstart_hook):
     """Phase 1: Hook exits silently when metadata missing but hook file exists."""
     (tmp_path / ".claude").mkdir(parents=True, exist_ok=True)
     (tmp_path / "sessions").mkdir(parents=True, exist_ok=True)
@@ -116,7 +157,7 @@ def test_kickstart_missing_metadata_with_hook_file_exits_silently(tmp_path: Path
     assert res.returncode == 0  # Should exit silently
 
 
-def test_kickstart_missing_metadata_no_hook_file_exits_silently(tmp_path: Path):
+def test_kickstart_missing_metadata_no_hook_file_exits_silently(tmp_path: Path, run_kickstart_hook):
     """Phase 1: Hook exits silently when metadata missing and no hook file."""
     (tmp_path / ".claude").mkdir(parents=True, exist_ok=True)
     (tmp_path / "sessions").mkdir(parents=True, exist_ok=True)
@@ -133,7 +174,7 @@ def test_kickstart_missing_metadata_no_hook_file_exits_silently(tmp_path: Path):
     assert res.returncode == 0  # Should exit silently
 
 
-def test_kickstart_active_shows_instructions(tmp_path: Path):
+def test_kickstart_active_shows_instructions(tmp_path: Path, run_kickstart_hook):
     """Phase 1: Hook shows instructions when kickstart is active and not complete."""
     kickstart_meta = {
         "mode": "full",
@@ -157,9 +198,23 @@ def test_kickstart_active_shows_instructions(tmp_path: Path):
            "discussion" in output["hookSpecificOutput"]["additionalContext"].lower()
 
 
+def test_kickstart_active_shows_instructions_as_script(tmp_path: Path):
+    """Same check through a real `python3 kickstart_session_start.py` process"""
+    setup_kickstart_state(tmp_path, {"mode": "full", "current_index": 0, "completed": []})
+    protocols_dir = tmp_path / "sessions" / "protocols" / "kickstart"
+    protocols_dir.mkdir(parents=True, exist_ok=True)
+    (protocols_dir / "01-discussion.md").write_text("# Discussion Protocol\n\nContent here")
+
+    res = run_kickstart_hook_subprocess(tmp_path)
+    assert res.returncode == 0
+    context = parse_hook_output(res.stdout)["hookSpecificOutput"]["additionalContext"]
+    assert context.startswith("# Discussion Protocol")
+    assert "USER INSTRUCTIONS" in context
+
+
 # ===== PHASE 2: COOLDOWN LOGIC TESTS =====
 
-def test_kickstart_first_time_shows_instructions(tmp_path: Path):
+def test_kickstart_first_time_shows_instructions(tmp_path: Path, run_kickstart_hook):
     """Phase 2: First-time kickstart (current_index=0) always shows instructions."""
     kickstart_meta = {
         "mode": "full",
@@ -184,7 +239,7 @@ def test_kickstart_first_time_shows_instructions(tmp_path: Path):
     assert "last_active" in state["metadata"]["kickstart"]
 
 
-def test_kickstart_cooldown_skips_instructions(tmp_path: Path):
+def test_kickstart_cooldown_skips_instructions(tmp_path: Path, run_kickstart_hook):
     """Phase 2: Instructions skipped if shown within last hour."""
     # Set last_shown to 30 minutes ago (within cooldown)
     last_shown_time = datetime.now() - timedelta(minutes=30)
@@ -210,7 +265,27 @@ def test_kickstart_cooldown_skips_instructions(tmp_path: Path):
     assert state["metadata"]["kickstart"]["last_active"] != last_shown_time.isoformat()
 
 
-def test_kickstart_cooldown_expired_shows_instructions(tmp_path: Path):
+def test_kickstart_cooldown_uses_epoch_timestamp(tmp_path: Path, run_kickstart_hook):
+    """Phase 2: last_shown_ns drives the cooldown when present."""
+    stale = datetime.now() - timedelta(hours=2)
+    kickstart_meta = {
+        "mode": "full",
+        "sequence": ["01-discussion.md", "02-implementation.md"],
+        "current_index": 1,
+        "completed": ["01-discussion.md"],
+        # ISO field says the cooldown expired; the epoch field says it was just shown
+        "last_shown": stale.isoformat(),
+        "last_shown_ns": time.time_ns() - 10 * 60 * 1_000_000_000,
+        "last_active": stale.isoformat()
+    }
+    setup_kickstart_state(tmp_path, kickstart_meta)
+
+    res = run_kickstart_hook(tmp_path)
+    assert res.returncode == 0
+    assert not res.stdout.strip() or "hookSpecificOutput" not in parse_hook_output(res.stdout)
+
+
+def test_kickstart_cooldown_expired_shows_instructions(tmp_path: Path, run_kickstart_hook):
     """Phase 2: Instructions shown if cooldown expired (>1 hour since last_shown)."""
     # Set last_shown to 2 hours ago (cooldown expired)
     last_shown_time = datetime.now() - timedelta(hours=2)
@@ -241,7 +316,7 @@ def test_kickstart_cooldown_expired_shows_instructions(tmp_path: Path):
     assert new_last_shown > last_shown_time
 
 
-def test_kickstart_in_progress_no_last_shown_shows_instructions(tmp_path: Path):
+def test_kickstart_in_progress_no_last_shown_shows_instructions(tmp_path: Path, run_kickstart_hook):
     """Phase 2: Instructions shown if in progress but no last_shown timestamp."""
     kickstart_meta = {
         "mode": "full",
@@ -265,7 +340,7 @@ def test_kickstart_in_progress_no_last_shown_shows_instructions(tmp_path: Path):
     assert "last_shown" in state["metadata"]["kickstart"]
 
 
-def test_kickstart_timestamp_tracking(tmp_path: Path):
+def test_kickstart_timestamp_tracking(tmp_path: Path, run_kickstart_hook):
     """Phase 2: Both last_shown and last_active timestamps are tracked correctly."""
     kickstart_meta = {
         "mode": "full",
@@ -294,7 +369,7 @@ def test_kickstart_timestamp_tracking(tmp_path: Path):
 
 # ===== COMPLETION COMMAND TESTS =====
 
-def test_kickstart_complete_sets_flag(tmp_path: Path):
+def test_kickstart_complete_sets_flag(tmp_path: Path, run_kickstart_hook):
     """Phase 1: Complete command sets onboarding_complete flag."""
     kickstart_meta = {
         "mode": "full",
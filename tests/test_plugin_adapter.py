@@ -1,4 +1,6 @@
 import json
+import os
+import sys
 
 
 def test_enforcement_plugin_smoke(monkeypatch):
@@ -18,3 +20,51 @@ def test_enforcement_plugin_smoke(monkeypatch):
     assert plugin.on_session_end()["ok"] is True
 
 
+def test_run_hook_in_process_matches_subprocess_contract(tmp_path, monkeypatch):
+    from cc_sessions.plugin import enforcement_plugin as ep
+
+    script = tmp_path / "echo_hook.py"
+    script.write_text(
+        "import json, sys\n"
+        "data = json.load(sys.stdin)\n"
+        "print(json.dumps({'seen': data['tool_name']}))\n"
+        "print('blocked', file=sys.stderr)\n"
+        "sys.exit(2)\n"
+    )
+    monkeypatch.setattr(ep, "_hook_path", lambda rel: tmp_path / rel)
+    stdin_before, cwd_before = sys.stdin, os.getcwd()
+
+    results = {}
+    for mode in ("0", "1"):
+        monkeypatch.setenv("CC_SESSIONS_PLUGIN_IN_PROCESS", mode)
+        results[mode] = ep._run_hook("echo_hook.py", payload={"tool_name": "Bash"})
+
+    for result in results.values():
+        assert result["ok"] is False
+        assert result["exit_code"] == 2
+        assert json.loads(result["stdout"]) == {"seen": "Bash"}
+        assert "blocked" in result["stderr"]
+    assert sys.stdin is stdin_before
+    assert os.getcwd() == cwd_before
+
+
+def test_in_process_import_error_is_not_rerun(tmp_path, monkeypatch):
+    from cc_sessions.plugin import enforcement_plugin as ep
+
+    marker = tmp_path / "runs.txt"
+    script = tmp_path / "partial_hook.py"
+    script.write_text(
+        f"with open({str(marker)!r}, 'a') as f:\n"
+        "    f.write('ran\\n')\n"
+        "import module_that_does_not_exist\n"
+    )
+    monkeypatch.setattr(ep, "_hook_path", lambda rel: tmp_path / rel)
+    monkeypatch.setenv("CC_SESSIONS_PLUGIN_IN_PROCESS", "1")
+    monkeypatch.setitem(sys.modules, "shared_state", object())
+
+    result = ep._run_hook("partial_hook.py", payload={})
+
+    assert result["exit_code"] == 1
+    assert "ModuleNotFoundError" in result["stderr"]
+    assert marker.read_text().splitlines() == ["ran"]
+    assert "shared_state" not in sys.modules
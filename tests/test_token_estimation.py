@@ -25,9 +25,7 @@ def _load_function_from_user_messages(func_name: str):
 
 def write_transcript(tmp: Path, entries: list[dict]) -> Path:
     p = tmp / "transcript.jsonl"
-    with p.open("w", encoding="utf-8", errors="backslashreplace") as f:
-        for e in entries:
-            f.write(json.dumps(e) + "\n")
+    p.write_text("".join(json.dumps(e) + "\n" for e in entries), encoding="utf-8", errors="backslashreplace")
     return p
 
 
@@ -128,8 +128,6 @@ def test_config_load_with_workspace_mode(tmp_path: Path):
     (tmp_path / "sessions" / "sessions-config.json").write_text(json.dumps(config))
 
     # Import and load config
-    import sys
-    sys.path.insert(0, str(repo_root() / "cc_sessions" / "python" / "hooks"))
     from shared_state import load_config
 
     loaded_config = load_config(project_root=tmp_path)